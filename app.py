@@ -1,9 +1,12 @@
 import streamlit as st
 import sqlite3
-import pandas as pd
-import json
+import hashlib
+import orjson
 import sys
 import platform
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -17,118 +20,339 @@ st.set_page_config(
 # Database initialization
 DB_PATH = "error_logger.db"
 
-def init_db():
-    """Initialize the database with required tables"""
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
+# WAL lets the reader connection run alongside the single writer. It is stored in the
+# database file, and cannot change inside a transaction, so it runs before the schema.
+SQL_PRAGMAS = '''
+    PRAGMA journal_mode=WAL;
+'''
+
+# Settings that only last for the connection they run on; NORMAL sync is safe under WAL
+SQL_CONNECTION_PRAGMAS = '''
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=268435456;
+    PRAGMA cache_size=-65536;
+    PRAGMA cache_spill=0;
+'''
+
+SQL_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS environments (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        python_version TEXT NOT NULL,
+        platform TEXT,
+        modules TEXT,
+        modules_hash BLOB NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE(python_version, modules_hash)
+    );
     
-    # Environments table
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS environments (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            python_version TEXT NOT NULL,
-            platform TEXT,
-            modules TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            UNIQUE(python_version, modules)
-        )
-    ''')
+    CREATE TABLE IF NOT EXISTS errors (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        error_name TEXT NOT NULL,
+        description TEXT,
+        error_type TEXT,
+        traceback TEXT,
+        fix TEXT,
+        complexity TEXT,
+        status TEXT DEFAULT 'Open',
+        tags TEXT,
+        environment_id INTEGER,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (environment_id) REFERENCES environments (id)
+    );
     
-    # Errors table
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS errors (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            error_name TEXT NOT NULL,
-            description TEXT,
-            error_type TEXT,
-            traceback TEXT,
-            fix TEXT,
-            complexity TEXT,
-            status TEXT DEFAULT 'Open',
-            tags TEXT,
-            environment_id INTEGER,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (environment_id) REFERENCES environments (id)
-        )
-    ''')
+    -- Indexes for the list ordering, per-environment lookups and filters
+    CREATE INDEX IF NOT EXISTS idx_errors_created ON errors (created_at DESC);
+    CREATE INDEX IF NOT EXISTS idx_errors_env ON errors (environment_id);
+    CREATE INDEX IF NOT EXISTS idx_errors_status_complexity ON errors (status, complexity);
+    
+    -- Trigram full-text index over the searchable error fields, kept in sync by triggers,
+    -- so searches match case-insensitive substrings rather than whole words
+    CREATE VIRTUAL TABLE IF NOT EXISTS errors_fts USING fts5(
+        error_name, description, fix, traceback,
+        content='errors', content_rowid='id', tokenize='trigram'
+    );
+    
+    CREATE TRIGGER IF NOT EXISTS errors_ai AFTER INSERT ON errors BEGIN
+        INSERT INTO errors_fts (rowid, error_name, description, fix, traceback)
+        VALUES (new.id, new.error_name, new.description, new.fix, new.traceback);
+    END;
+    
+    CREATE TRIGGER IF NOT EXISTS errors_ad AFTER DELETE ON errors BEGIN
+        INSERT INTO errors_fts (errors_fts, rowid, error_name, description, fix, traceback)
+        VALUES ('delete', old.id, old.error_name, old.description, old.fix, old.traceback);
+    END;
+    
+    CREATE TRIGGER IF NOT EXISTS errors_au AFTER UPDATE ON errors BEGIN
+        INSERT INTO errors_fts (errors_fts, rowid, error_name, description, fix, traceback)
+        VALUES ('delete', old.id, old.error_name, old.description, old.fix, old.traceback);
+        INSERT INTO errors_fts (rowid, error_name, description, fix, traceback)
+        VALUES (new.id, new.error_name, new.description, new.fix, new.traceback);
+    END;
+'''
+
+SQL_MIGRATE_MODULES_HASH = '''
+    ALTER TABLE environments ADD COLUMN modules_hash BLOB;
+    UPDATE environments SET modules_hash = hash_modules(modules);
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_environments_hash
+    ON environments (python_version, modules_hash);
+'''
+
+# Hot statements kept as constants so the connection's statement cache reuses them
+SQL_SELECT_ENV = '''
+    SELECT id FROM environments 
+    WHERE python_version = ? AND modules_hash = ?
+'''
+
+SQL_INSERT_ENV = '''
+    INSERT INTO environments (python_version, platform, modules, modules_hash)
+    VALUES (?, ?, ?, ?)
+'''
+
+SQL_INSERT_ERROR = '''
+    INSERT INTO errors (
+        error_name, description, error_type, traceback, 
+        fix, complexity, status, tags, environment_id
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+SQL_LIST_ERRORS = '''
+    SELECT 
+        e.id,
+        e.error_name,
+        e.description,
+        e.error_type,
+        e.traceback,
+        e.fix,
+        e.complexity,
+        e.status,
+        COALESCE(e.tags, '[]') AS tags,
+        strftime('%Y-%m-%d %H:%M', e.created_at) AS created_at,
+        e.updated_at,
+        env.python_version,
+        env.platform
+    FROM errors e
+    LEFT JOIN environments env ON e.environment_id = env.id
+    ORDER BY e.created_at DESC
+'''
+
+def connect():
+    """Open a database connection with the per-connection settings applied"""
+    conn = sqlite3.connect(
+        DB_PATH, check_same_thread=False, isolation_level=None, cached_statements=256
+    )
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SQL_CONNECTION_PRAGMAS)
+    return conn
+
+@st.cache_resource
+def get_conn():
+    """Get the shared writer connection, reused across reruns"""
+    return connect()
+
+@st.cache_resource
+def get_read_conn():
+    """Get the shared reader connection, which never sees uncommitted writes"""
+    return connect()
+
+@st.cache_resource
+def get_write_lock():
+    """Get the lock serializing writes on the shared writer connection"""
+    return threading.Lock()
+
+def hash_modules(modules):
+    """Get a compact digest of a JSON-encoded module list for environment lookups"""
+    # Re-encode canonically so lists stored with other JSON separators hash the same
+    canonical = orjson.dumps(orjson.loads(modules) if modules else {}, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(canonical, digest_size=16).digest()
+
+@st.cache_resource
+def init_db():
+    """Initialize the database with required tables, once per process"""
+    conn = get_conn()
     
-    conn.commit()
-    conn.close()
+    with get_write_lock():
+        tables = {
+            row['name']: row['sql']
+            for row in conn.execute("SELECT name, sql FROM sqlite_master WHERE type = 'table'")
+        }
+        env_columns = [row['name'] for row in conn.execute('PRAGMA table_info(environments)')]
+        
+        script = [SQL_PRAGMAS, 'BEGIN;']
+        fts_sql = tables.get('errors_fts')
+        if fts_sql and 'trigram' not in fts_sql:
+            # Word-tokenized indexes from older versions are recreated with trigrams
+            script.append('DROP TABLE errors_fts;')
+            del tables['errors_fts']
+        script.append(SQL_SCHEMA)
+        if env_columns and 'modules_hash' not in env_columns:
+            # Databases created before modules_hash existed get the column backfilled
+            conn.create_function('hash_modules', 1, hash_modules, deterministic=True)
+            script.append(SQL_MIGRATE_MODULES_HASH)
+        if 'errors_fts' not in tables:
+            # Index errors logged before the full-text table existed
+            script.append("INSERT INTO errors_fts (errors_fts) VALUES ('rebuild');")
+        script.append('COMMIT;')
+        
+        try:
+            conn.executescript('\n'.join(script))
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
 
+@st.cache_resource
 def get_current_environment():
-    """Get current Python environment info"""
+    """Get current Python environment info, scanned once per process"""
     modules = {}
     try:
-        import pkg_resources
-        installed_packages = pkg_resources.working_set
-        modules = {d.project_name: d.version for d in installed_packages}
+        from importlib.metadata import distributions
+        # Metadata reads are I/O-bound, so a thread pool overlaps them on slow filesystems
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            pairs = executor.map(lambda d: (d.metadata['Name'], d.version), distributions())
+            for name, version in pairs:
+                # Earlier sys.path entries shadow later copies, so keep the first one seen
+                if name:
+                    modules.setdefault(name, version)
     except:
         pass
     
     return {
         'python_version': sys.version.split()[0],
         'platform': platform.platform(),
-        'modules': json.dumps(modules, sort_keys=True)
+        'modules': orjson.dumps(modules, option=orjson.OPT_SORT_KEYS).decode()
     }
 
 def get_or_create_environment(env_info):
     """Get existing environment or create new one"""
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    
-    c.execute('''
-        SELECT id FROM environments 
-        WHERE python_version = ? AND modules = ?
-    ''', (env_info['python_version'], env_info['modules']))
+    conn = get_conn()
+    modules_hash = hash_modules(env_info['modules'])
     
-    result = c.fetchone()
-    
-    if result:
-        env_id = result[0]
-    else:
-        c.execute('''
-            INSERT INTO environments (python_version, platform, modules)
-            VALUES (?, ?, ?)
-        ''', (env_info['python_version'], env_info['platform'], env_info['modules']))
-        env_id = c.lastrowid
+    with get_write_lock():
+        c = conn.cursor()
+        
+        c.execute(SQL_SELECT_ENV, (env_info['python_version'], modules_hash))
+        
+        result = c.fetchone()
+        
+        if result:
+            env_id = result[0]
+        else:
+            c.execute(SQL_INSERT_ENV, (
+                env_info['python_version'], env_info['platform'], env_info['modules'], modules_hash
+            ))
+            env_id = c.lastrowid
+            get_all_environments.clear()
     
-    conn.commit()
-    conn.close()
     return env_id
 
+@st.cache_resource
+def get_current_environment_id():
+    """Get the ID of the current environment, registering it once per process"""
+    return get_or_create_environment(get_current_environment())
+
 def save_error(error_data):
     """Save error to database"""
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    
-    tags_str = json.dumps(error_data.get('tags', [])) if error_data.get('tags') else None
+    save_errors_bulk([error_data])
+
+def save_errors_bulk(errors):
+    """Save several errors to database in a single transaction"""
+    conn = get_conn()
     
-    c.execute('''
-        INSERT INTO errors (
-            error_name, description, error_type, traceback, 
-            fix, complexity, status, tags, environment_id
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-    ''', (
-        error_data['error_name'],
-        error_data.get('description'),
-        error_data.get('error_type'),
-        error_data.get('traceback'),
-        error_data.get('fix'),
-        error_data.get('complexity'),
-        error_data.get('status', 'Open'),
-        tags_str,
-        error_data.get('environment_id')
-    ))
+    rows = [
+        (
+            error_data['error_name'],
+            error_data.get('description'),
+            error_data.get('error_type'),
+            error_data.get('traceback'),
+            error_data.get('fix'),
+            error_data.get('complexity'),
+            error_data.get('status', 'Open'),
+            orjson.dumps(error_data['tags']).decode() if error_data.get('tags') else None,
+            error_data.get('environment_id')
+        )
+        for error_data in errors
+    ]
     
-    conn.commit()
-    conn.close()
+    # The connection is in autocommit mode, so open the transaction explicitly
+    with get_write_lock():
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(SQL_INSERT_ERROR, rows)
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
 
+def iter_errors(query, params=()):
+    """Yield rows of an errors query one at a time, with tags decoded"""
+    for row in get_read_conn().execute(query, params):
+        error = dict(row)
+        # Queries coalesce missing tags to '[]'; only non-empty lists need decoding
+        if 'tags' in error:
+            error['tags'] = orjson.loads(error['tags']) if error['tags'] != '[]' else []
+        yield error
+
+@st.cache_data(ttl=30, show_spinner=False)
 def get_all_errors():
     """Get all errors with environment info"""
-    conn = sqlite3.connect(DB_PATH)
+    return list(iter_errors(SQL_LIST_ERRORS))
+
+@st.cache_data(ttl=10, show_spinner=False)
+def get_error_metrics():
+    """Get summary counts of all errors in a single aggregate query"""
+    row = get_read_conn().execute('''
+        SELECT 
+            COUNT(*) AS total,
+            COALESCE(SUM(status = 'Open'), 0) AS open,
+            COALESCE(SUM(status = 'Resolved'), 0) AS resolved,
+            COALESCE(SUM(complexity = 'Critical'), 0) AS critical
+        FROM errors
+    ''').fetchone()
+    return dict(row)
+
+@st.cache_data(ttl=30, show_spinner=False)
+def get_filter_options():
+    """Get the distinct statuses and complexities available for filtering"""
+    conn = get_read_conn()
+    statuses = [row[0] for row in conn.execute(
+        'SELECT DISTINCT status FROM errors WHERE status IS NOT NULL ORDER BY status'
+    )]
+    complexities = [row[0] for row in conn.execute(
+        'SELECT DISTINCT complexity FROM errors WHERE complexity IS NOT NULL ORDER BY complexity'
+    )]
+    return statuses, complexities
+
+@st.cache_data(ttl=30, show_spinner=False)
+def search_errors(statuses=(), complexities=(), search_term=""):
+    """Get errors matching the given statuses, complexities and search term"""
+    joins = ""
+    order_by = "e.created_at DESC"
+    where = []
+    params = []
+    if len(search_term) >= 3:
+        # Quote the term as one phrase so the trigram index matches it as a substring
+        # and user input is never parsed as FTS syntax
+        phrase = '"' + search_term.replace('"', '""') + '"'
+        joins = "JOIN errors_fts f ON f.rowid = e.id"
+        order_by = "f.rank"
+        where.append("errors_fts MATCH ?")
+        params.append(f"{{error_name description}}: {phrase}")
+    elif search_term:
+        # Trigrams need at least three characters, so shorter terms fall back to LIKE
+        pattern = "%" + search_term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        where.append("(e.error_name LIKE ? ESCAPE '\\' OR e.description LIKE ? ESCAPE '\\')")
+        params.extend([pattern, pattern])
+    if statuses:
+        where.append(f"e.status IN ({', '.join('?' * len(statuses))})")
+        params.extend(statuses)
+    if complexities:
+        where.append(f"e.complexity IN ({', '.join('?' * len(complexities))})")
+        params.extend(complexities)
+    where_sql = f"WHERE {' AND '.join(where)}" if where else ""
     
-    query = '''
+    query = f'''
         SELECT 
             e.id,
             e.error_name,
@@ -138,60 +362,56 @@ def get_all_errors():
             e.fix,
             e.complexity,
             e.status,
-            e.tags,
             e.created_at,
             e.updated_at,
             env.python_version,
             env.platform
         FROM errors e
         LEFT JOIN environments env ON e.environment_id = env.id
-        ORDER BY e.created_at DESC
+        {joins}
+        {where_sql}
+        ORDER BY {order_by}
     '''
     
-    df = pd.read_sql_query(query, conn)
-    conn.close()
-    
-    if not df.empty and 'tags' in df.columns:
-        df['tags'] = df['tags'].apply(lambda x: json.loads(x) if x else [])
-    
-    return df
+    return list(iter_errors(query, params))
 
+@st.cache_data(ttl=30, show_spinner=False)
 def get_all_environments():
     """Get all environments"""
-    conn = sqlite3.connect(DB_PATH)
-    df = pd.read_sql_query('SELECT * FROM environments ORDER BY created_at DESC', conn)
-    conn.close()
+    import pandas as pd
+    
+    conn = get_read_conn()
+    query = '''
+        SELECT 
+            id,
+            python_version,
+            platform,
+            modules,
+            strftime('%Y-%m-%d %H:%M', created_at) AS created_at
+        FROM environments
+        ORDER BY environments.created_at DESC
+    '''
+    
+    df = pd.read_sql_query(query, conn)
     return df
 
-def get_errors_by_environment(env_id):
-    """Get errors for a specific environment"""
-    conn = sqlite3.connect(DB_PATH)
-    
+@st.cache_data(ttl=30, show_spinner=False)
+def get_errors_grouped_by_environment():
+    """Get errors for every environment in one query, keyed by environment ID"""
     query = '''
         SELECT 
-            e.id,
+            e.environment_id,
             e.error_name,
-            e.description,
-            e.error_type,
-            e.traceback,
-            e.fix,
-            e.complexity,
-            e.status,
-            e.tags,
-            e.created_at,
-            e.updated_at
+            e.status
         FROM errors e
-        WHERE e.environment_id = ?
-        ORDER BY e.created_at DESC
+        WHERE e.environment_id IN (SELECT id FROM environments)
+        ORDER BY e.environment_id, e.created_at DESC
     '''
     
-    df = pd.read_sql_query(query, conn, params=(env_id,))
-    conn.close()
-    
-    if not df.empty and 'tags' in df.columns:
-        df['tags'] = df['tags'].apply(lambda x: json.loads(x) if x else [])
-    
-    return df
+    grouped = defaultdict(list)
+    for row in get_read_conn().execute(query):
+        grouped[row['environment_id']].append({'error_name': row['error_name'], 'status': row['status']})
+    return dict(grouped)
 
 # Initialize database
 init_db()
@@ -213,7 +433,7 @@ if page == "Log Error":
         st.json(current_env)
     
     # Auto-register current environment
-    env_id = get_or_create_environment(current_env)
+    env_id = get_current_environment_id()
     st.info(f"📌 Current environment ID: {env_id}")
     
     with st.form("error_form"):
@@ -232,7 +452,7 @@ if page == "Log Error":
             if not use_current_env:
                 envs = get_all_environments()
                 if not envs.empty:
-                    env_options = [f"ID {row['id']}: Python {row['python_version']}" for _, row in envs.iterrows()]
+                    env_options = [f"ID {row['id']}: Python {row['python_version']}" for row in envs.to_dict('records')]
                     selected_env = st.selectbox("Select Environment", env_options)
                     custom_env_id = int(selected_env.split(":")[0].replace("ID ", ""))
         
@@ -261,32 +481,39 @@ if page == "Log Error":
                 }
                 
                 save_error(error_data)
+                get_all_errors.clear()
+                get_all_environments.clear()
+                get_errors_grouped_by_environment.clear()
+                search_errors.clear()
+                get_filter_options.clear()
+                get_error_metrics.clear()
                 st.success("✅ Error logged successfully!")
                 st.balloons()
 
 elif page == "View Errors":
     st.header("All Errors")
     
-    errors_df = get_all_errors()
+    errors = get_all_errors()
     
-    if errors_df.empty:
+    if not errors:
         st.info("No errors logged yet. Go to 'Log Error' to add your first error.")
     else:
         # Display summary
+        metrics = get_error_metrics()
         col1, col2, col3, col4 = st.columns(4)
         with col1:
-            st.metric("Total Errors", len(errors_df))
+            st.metric("Total Errors", metrics['total'])
         with col2:
-            st.metric("Open", len(errors_df[errors_df['status'] == 'Open']))
+            st.metric("Open", metrics['open'])
         with col3:
-            st.metric("Resolved", len(errors_df[errors_df['status'] == 'Resolved']))
+            st.metric("Resolved", metrics['resolved'])
         with col4:
-            st.metric("Critical", len(errors_df[errors_df['complexity'] == 'Critical']))
+            st.metric("Critical", metrics['critical'])
         
         st.divider()
         
         # Display errors
-        for idx, row in errors_df.iterrows():
+        for row in errors:
             with st.expander(f"🔴 {row['error_name']} - {row['status']} ({row['complexity']})"):
                 col1, col2 = st.columns([2, 1])
                 
@@ -302,7 +529,7 @@ elif page == "View Errors":
                         st.write("**Tags:**", ", ".join(row['tags']))
                 
                 with col2:
-                    st.write("**Created:**", pd.to_datetime(row['created_at']).strftime("%Y-%m-%d %H:%M"))
+                    st.write("**Created:**", row['created_at'])
                     if row['python_version']:
                         st.write("**Python:**", row['python_version'])
                     if row['platform']:
@@ -320,67 +547,55 @@ elif page == "Environments":
         st.metric("Total Environments", len(envs_df))
         st.divider()
         
-        for idx, row in envs_df.iterrows():
+        errors_by_env = get_errors_grouped_by_environment()
+        
+        for row in envs_df.to_dict('records'):
             with st.expander(f"Environment ID {row['id']} - Python {row['python_version']}"):
                 col1, col2 = st.columns(2)
                 
                 with col1:
                     st.write("**Python Version:**", row['python_version'])
                     st.write("**Platform:**", row['platform'])
-                    st.write("**Created:**", pd.to_datetime(row['created_at']).strftime("%Y-%m-%d %H:%M"))
+                    st.write("**Created:**", row['created_at'])
                 
                 with col2:
                     if row['modules']:
-                        modules = json.loads(row['modules'])
+                        modules = orjson.loads(row['modules'])
                         st.write(f"**Installed Modules ({len(modules)}):**")
                         st.json(modules)
                 
                 # Show errors for this environment
-                env_errors = get_errors_by_environment(row['id'])
-                if not env_errors.empty:
+                env_errors = errors_by_env.get(row['id'], [])
+                if env_errors:
                     st.write(f"**Errors in this environment ({len(env_errors)}):**")
-                    for _, err in env_errors.iterrows():
+                    for err in env_errors:
                         st.write(f"- {err['error_name']} ({err['status']})")
 
 elif page == "Search & Filter":
     st.header("Search & Filter Errors")
     
-    errors_df = get_all_errors()
-    
-    if errors_df.empty:
+    if not get_error_metrics()['total']:
         st.info("No errors to search.")
     else:
+        status_options, complexity_options = get_filter_options()
         col1, col2, col3 = st.columns(3)
         
         with col1:
             search_term = st.text_input("Search by name or description")
         with col2:
-            filter_status = st.multiselect("Filter by Status", errors_df['status'].unique().tolist())
+            filter_status = st.multiselect("Filter by Status", status_options)
         with col3:
-            filter_complexity = st.multiselect("Filter by Complexity", errors_df['complexity'].unique().tolist())
-        
-        # Apply filters
-        filtered_df = errors_df.copy()
-        
-        if search_term:
-            mask = (
-                filtered_df['error_name'].str.contains(search_term, case=False, na=False) |
-                filtered_df['description'].str.contains(search_term, case=False, na=False)
-            )
-            filtered_df = filtered_df[mask]
-        
-        if filter_status:
-            filtered_df = filtered_df[filtered_df['status'].isin(filter_status)]
+            filter_complexity = st.multiselect("Filter by Complexity", complexity_options)
         
-        if filter_complexity:
-            filtered_df = filtered_df[filtered_df['complexity'].isin(filter_complexity)]
+        # Filters and the full-text search are applied in SQL
+        filtered = search_errors(filter_status, filter_complexity, search_term)
         
-        st.write(f"**Found {len(filtered_df)} error(s)**")
+        st.write(f"**Found {len(filtered)} error(s)**")
         st.divider()
         
-        if not filtered_df.empty:
+        if filtered:
             # Display filtered results
-            for idx, row in filtered_df.iterrows():
+            for row in filtered:
                 with st.expander(f"🔴 {row['error_name']} - {row['status']} ({row['complexity']})"):
                     st.write("**Description:**", row['description'] or "N/A")
                     if row['error_type']: